@@ -1,5 +1,9 @@
 import os
+import json
+import hashlib
 import kopf
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 from kubernetes import client, config as kube_config
 import logging
 from tetrate import TetrateConnection, Organization, Tenant, Workspace, WorkspaceSetting, GatewayGroup, Gateway
@@ -30,6 +34,14 @@ core_v1_api = client.CoreV1Api()
 # Global variables
 tetrate = None
 agent_config = None
+_last_tetrate_hash = None  # Digest of the last Tetrate config that was connected and verified
+
+# Worker pool for reconciling namespaces concurrently; TSB calls are I/O bound
+_WORKERS = int(os.getenv('ARCA_WORKERS', '10'))
+_EXECUTOR = ThreadPoolExecutor(max_workers=_WORKERS)
+# Pool for the two per-workspace sub-resource calls. Kept apart from _EXECUTOR, whose tasks
+# block on these: sharing one pool could fill it with waiters and deadlock.
+_RESOURCE_EXECUTOR = ThreadPoolExecutor(max_workers=2 * _WORKERS)
 
 AGENT_CONFIG_NAME = "default"  # Default name for the AgentConfig resource
 FINALIZER = 'operator.arca.io/cleanup'  # Define a proper finalizer name
@@ -45,11 +57,11 @@ def configure(settings: kopf.OperatorSettings, **_):
     settings.execution.max_workers = 10
     settings.persistence.finalizer = FINALIZER  # Set the finalizer
     settings.posting.enabled = True
-    logger.debug(f"Operator settings configured with finalizer: {FINALIZER}")
+    logger.debug("Operator settings configured with finalizer: %s", FINALIZER)
 
 def process_agentconfig(spec: dict) -> dict:
     """Process AgentConfig and return a structured configuration."""
-    logger.debug(f"Processing AgentConfig spec: {spec}")
+    logger.debug("Processing AgentConfig spec: %s", spec)
     config = {
         'discovery_label': spec.get('discoveryLabel'),
         'service_fabric': spec.get('serviceFabric'),
@@ -60,9 +72,9 @@ def process_agentconfig(spec: dict) -> dict:
         try:
             key, value = config['discovery_label'].split('=', 1)
             config.update({'discovery_key': key, 'discovery_value': value})
-            logger.debug(f"Parsed discovery label: key={key}, value={value}")
+            logger.debug("Parsed discovery label: key=%s, value=%s", key, value)
         except ValueError:
-            logger.error(f"Invalid discoveryLabel format: '{config['discovery_label']}'")
+            logger.error("Invalid discoveryLabel format: '%s'", config['discovery_label'])
             raise ValueError(f"Invalid discoveryLabel format: '{config['discovery_label']}'")
 
     if not config['service_fabric']:
@@ -93,8 +105,17 @@ def initialize_tetrate_connection(tetrate_config):
         logger.error("Either apiToken or username/password combination is required for Tetrate authentication")
         return False
 
+    # kopf re-runs the handler on resume and on unrelated spec updates; skip the reconnect
+    # and verification round trip when the Tetrate settings did not change
+    global _last_tetrate_hash
+    tetrate_hash = hashlib.blake2b(json.dumps(tetrate_config, sort_keys=True).encode(), digest_size=16).digest()
+    if tetrate_hash == _last_tetrate_hash and TetrateConnection._instance is not None:
+        logger.debug("Tetrate configuration unchanged, keeping the existing connection")
+        return True
+
+    previous = TetrateConnection._instance
     try:
-        logger.debug(f"Initializing Tetrate connection with config: {tetrate_config}")
+        logger.debug("Initializing Tetrate connection with config: %s", tetrate_config)
         # Create new TetrateConnection instance
         TetrateConnection(
             endpoint=tetrate_config.get('endpoint'),
@@ -109,17 +130,30 @@ def initialize_tetrate_connection(tetrate_config):
         org = Organization(TetrateConnection.get_instance().organization)
         org.get()  # This will throw an error if credentials are invalid
         
+        _last_tetrate_hash = tetrate_hash
+        if previous is not None:
+            # Release the pooled connections of the connection this one replaced
+            previous.close()
         logger.info("Tetrate connection initialized and verified successfully")
         return True
     except Exception as e:
-        logger.error(f"Failed to initialize Tetrate connection: {str(e)}")
+        logger.error("Failed to initialize Tetrate connection: %s", e)
+        # The constructor installs itself as the singleton before it is verified;
+        # put back the last verified connection so _last_tetrate_hash still describes it
+        failed = TetrateConnection._instance
+        if failed is not previous:
+            TetrateConnection._instance = previous
+            failed.close()
         raise
 
-def workspace_manager(namespace_name):
-    """Create or update a workspace and its settings in Tetrate."""
+def workspace_manager(namespace_name, workspaces=None):
+    """Create or update a workspace and its settings in Tetrate.
+
+    workspaces is an optional Tenant.list_workspaces() result used instead of fetching the workspace.
+    """
     try:
         tetrate = TetrateConnection.get_instance()
-        logger.debug(f"Checking workspace for namespace: {namespace_name}")
+        logger.debug("Checking workspace for namespace: %s", namespace_name)
         
         # Initialize objects
         organization = Organization(tetrate.organization)
@@ -147,8 +181,10 @@ def workspace_manager(namespace_name):
         
         # Create workspace instance and create/update it
         workspace = Workspace(tenant=tenant, name=namespace_name)
+        if workspaces is not None:
+            workspace.get(prefetched=workspaces)
         workspace_response = workspace.create_or_update(desired_workspace_data)
-        logger.info(f"Workspace '{namespace_name}' created/updated successfully")
+        logger.info("Workspace '%s' created/updated successfully", namespace_name)
         
         # Create or update workspace settings
         workspace_setting = WorkspaceSetting(workspace=workspace, name='default')
@@ -177,45 +213,52 @@ def workspace_manager(namespace_name):
             }
         }
         
-        try:
-            # Create or update the workspace settings
-            settings_response = workspace_setting.create_or_update(workspace_settings)
-            logger.info(f"Workspace settings for '{namespace_name}' created/updated successfully")
-            
-            # Create or update gateway group
-            gateway_group = GatewayGroup(workspace=workspace, name=f"{namespace_name}-gateways")
-            
-            # Configure gateway group with serviceFabric
-            gateway_group_config = {
-                'displayName': f'Gateway Group for {namespace_name}',
-                'configMode': 'BRIDGED',
-                'namespaceSelector': {
-                    'names': [
-                        f'{agent_config.get("service_fabric", "*")}/{namespace_name}'
-                    ]
-                },
-                'configGenerationMetadata': {
-                    'labels': {
-                        'arca.io/managed': 'true',
-                        'arca.io/namespace': namespace_name,
-                        'arca.io/cluster': agent_config["tetrate"].get("clusterName", ""),
-                        'arca.io/service-fabric': agent_config.get("service_fabric", "")
-                    }
+        # Create or update gateway group
+        gateway_group = GatewayGroup(workspace=workspace, name=f"{namespace_name}-gateways")
+        
+        # Configure gateway group with serviceFabric
+        gateway_group_config = {
+            'displayName': f'Gateway Group for {namespace_name}',
+            'configMode': 'BRIDGED',
+            'namespaceSelector': {
+                'names': [
+                    f'{agent_config.get("service_fabric", "*")}/{namespace_name}'
+                ]
+            },
+            'configGenerationMetadata': {
+                'labels': {
+                    'arca.io/managed': 'true',
+                    'arca.io/namespace': namespace_name,
+                    'arca.io/cluster': agent_config["tetrate"].get("clusterName", ""),
+                    'arca.io/service-fabric': agent_config.get("service_fabric", "")
                 }
             }
+        }
+        
+        try:
+            # Settings and gateway group only depend on the workspace, so overlap their TSB round-trips.
+            # Each task runs in a copy of our context so a TetrateConnection.use() override follows it.
+            settings_future = _RESOURCE_EXECUTOR.submit(
+                copy_context().run, workspace_setting.create_or_update, workspace_settings
+            )
+            gateway_future = _RESOURCE_EXECUTOR.submit(
+                copy_context().run, gateway_group.create_or_update, gateway_group_config
+            )
             
-            # Create or update the gateway group
-            gateway_response = gateway_group.create_or_update(gateway_group_config)
-            logger.info(f"Gateway group for '{namespace_name}' created/updated successfully")
+            settings_response = settings_future.result()
+            logger.info("Workspace settings for '%s' created/updated successfully", namespace_name)
+            
+            gateway_response = gateway_future.result()
+            logger.info("Gateway group for '%s' created/updated successfully", namespace_name)
             
         except Exception as e:
-            logger.error(f"Error creating/updating workspace resources for '{namespace_name}': {str(e)}")
+            logger.error("Error creating/updating workspace resources for '%s': %s", namespace_name, e)
             raise
             
     except ValueError as e:
-        logger.warning(f"Tetrate connection not initialized: {str(e)}")
+        logger.warning("Tetrate connection not initialized: %s", e)
     except Exception as e:
-        logger.error(f"Error handling workspace for namespace '{namespace_name}': {str(e)}")
+        logger.error("Error handling workspace for namespace '%s': %s", namespace_name, e)
 
 @kopf.on.create('operator.arca.io', 'v1alpha1', 'agentconfigs')
 @kopf.on.update('operator.arca.io', 'v1alpha1', 'agentconfigs')
@@ -223,17 +266,17 @@ def workspace_manager(namespace_name):
 def handle_agentconfig(spec, name, meta, status, **kwargs):
     """Handle creation and updates of AgentConfig resources."""
     if name != AGENT_CONFIG_NAME:
-        logger.warning(f"Ignoring AgentConfig '{name}' as it's not the default name '{AGENT_CONFIG_NAME}'")
+        logger.warning("Ignoring AgentConfig '%s' as it's not the default name '%s'", name, AGENT_CONFIG_NAME)
         return
 
     global agent_config
     try:
-        logger.debug(f"Handling AgentConfig with spec: {spec}")
+        logger.debug("Handling AgentConfig with spec: %s", spec)
         agent_config = process_agentconfig(spec)
         initialize_tetrate_connection(agent_config['tetrate'])
         logger.info("Configuration updated for AgentConfig")
     except Exception as e:
-        logger.error(f"Failed to process AgentConfig: {str(e)}")
+        logger.error("Failed to process AgentConfig: %s", e)
         raise kopf.PermanentError(f"Configuration failed: {str(e)}")
 
 @kopf.on.delete('operator.arca.io', 'v1alpha1', 'agentconfigs')
@@ -242,10 +285,11 @@ def delete_agentconfig(spec, name, **kwargs):
     if name != AGENT_CONFIG_NAME:
         return
     
-    global agent_config, tetrate
-    logger.info(f"Cleaning up AgentConfig: {name}")
+    global agent_config, tetrate, _last_tetrate_hash
+    logger.info("Cleaning up AgentConfig: %s", name)
     agent_config = None
     tetrate = None
+    _last_tetrate_hash = None
 
 @kopf.on.event('', 'v1', 'namespaces')
 def watch_namespaces(event, name, meta, logger, **kwargs):
@@ -263,11 +307,11 @@ def watch_namespaces(event, name, meta, logger, **kwargs):
         
         # Handle different event types
         event_type = event['type']
-        logger.debug(f"Processing namespace event: {event_type} for {name}, has_label={has_required_label}")
+        logger.debug("Processing namespace event: %s for %s, has_label=%s", event_type, name, has_required_label)
         
         if event_type == 'ADDED' and has_required_label:
             # New namespace with the required label
-            logger.info(f"New namespace {name} created with required label")
+            logger.info("New namespace %s created with required label", name)
             workspace_manager(name)
             
         elif event_type == 'MODIFIED':
@@ -280,15 +324,15 @@ def watch_namespaces(event, name, meta, logger, **kwargs):
             
             if not had_required_label and has_required_label:
                 # Label was added
-                logger.info(f"Required label added to namespace {name}")
+                logger.info("Required label added to namespace %s", name)
                 workspace_manager(name)
             elif had_required_label and not has_required_label:
                 # Label was removed
-                logger.info(f"Required label removed from namespace {name}")
+                logger.info("Required label removed from namespace %s", name)
                 # Optionally handle workspace cleanup here
                 
     except Exception as e:
-        logger.error(f"Error processing namespace {name}: {str(e)}")
+        logger.error("Error processing namespace %s: %s", name, e)
         raise kopf.TemporaryError(f"Failed to process namespace: {str(e)}", delay=60)
 
 @kopf.timer('operator.arca.io', 'v1alpha1', 'agentconfigs',
@@ -309,14 +353,28 @@ def periodic_workspace_reconciliation(spec, name, logger, **kwargs):
     try:
         key, value = agent_config['discovery_label'].split('=')
         namespaces = core_v1_api.list_namespace(label_selector=f"{key}={value}").items
-        logger.info(f"Reconciliation: Found namespaces with label {agent_config['discovery_label']}: "
-                   f"{[ns.metadata.name for ns in namespaces]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Reconciliation: Found namespaces with label %s: %s",
+                        agent_config['discovery_label'], [ns.metadata.name for ns in namespaces])
+        
+        # One listing call up front instead of a GET per workspace
+        try:
+            tetrate = TetrateConnection.get_instance()
+            workspaces = Tenant(Organization(tetrate.organization), tetrate.tenant).list_workspaces()
+        except Exception as e:
+            logger.warning("Could not list workspaces, fetching them individually: %s", e)
+            workspaces = None
         
-        for ns in namespaces:
-            workspace_manager(ns.metadata.name)
+        # Each task gets its own copy of our context: a Context cannot be entered by two threads at once
+        futures = [
+            _EXECUTOR.submit(copy_context().run, workspace_manager, ns.metadata.name, workspaces)
+            for ns in namespaces
+        ]
+        for future in as_completed(futures):
+            future.result()
                 
     except Exception as e:
-        logger.error(f"Error during periodic reconciliation: {str(e)}")
+        logger.error("Error during periodic reconciliation: %s", e)
         raise kopf.TemporaryError(f"Reconciliation failed: {str(e)}", delay=300)
 
 def handle_service_exposure(service, namespace_name, workspace):
@@ -333,7 +391,7 @@ def handle_service_exposure(service, namespace_name, workspace):
         path = annotations.get(PATH_ANNOTATION, '/')
         
         if not domain:
-            logger.warning(f"Service {service.metadata.name} missing domain annotation")
+            logger.warning("Service %s missing domain annotation", service.metadata.name)
             return
             
         # Get or create gateway group
@@ -410,7 +468,7 @@ def handle_service_exposure(service, namespace_name, workspace):
         }
         
         gateway.create_or_update(gateway_config)
-        logger.info(f"Gateway created/updated for service {service.metadata.name} in namespace {namespace_name}")
+        logger.info("Gateway created/updated for service %s in namespace %s", service.metadata.name, namespace_name)
         
         # Update service status
         patch = {
@@ -429,7 +487,7 @@ def handle_service_exposure(service, namespace_name, workspace):
         )
         
     except Exception as e:
-        logger.error(f"Error handling service exposure for {service.metadata.name}: {str(e)}")
+        logger.error("Error handling service exposure for %s: %s", service.metadata.name, e)
         # Update service status with error
         patch = {
             'metadata': {
@@ -458,7 +516,7 @@ def watch_services(event, name, meta, namespace, spec, **kwargs):
         
         # Skip if namespace doesn't have the required label
         if namespace_obj.metadata.labels.get(key) != value:
-            logger.debug(f"Skipping service {name} in namespace {namespace} - namespace doesn't have required label")
+            logger.debug("Skipping service %s in namespace %s - namespace doesn't have required label", name, namespace)
             return
             
         # Get service details
@@ -477,13 +535,13 @@ def watch_services(event, name, meta, namespace, spec, **kwargs):
             handle_service_exposure(service, namespace, workspace)
             
         except ValueError as e:
-            logger.debug(f"Tetrate connection not initialized yet, skipping service {name}")
+            logger.debug("Tetrate connection not initialized yet, skipping service %s", name)
             return
         
     except client.exceptions.ApiException as e:
         if e.status == 404:
-            logger.debug(f"Service {name} or namespace {namespace} not found")
+            logger.debug("Service %s or namespace %s not found", name, namespace)
             return
-        logger.error(f"API error processing service {name} in namespace {namespace}: {str(e)}")
+        logger.error("API error processing service %s in namespace %s: %s", name, namespace, e)
     except Exception as e:
-        logger.error(f"Error processing service {name} in namespace {namespace}: {str(e)}")
\ No newline at end of file
+        logger.error("Error processing service %s in namespace %s: %s", name, namespace, e)
\ No newline at end of file
@@ -0,0 +1,49 @@
+import cProfile
+import pstats
+import re
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+PROFILE_DIR = Path('.prof')
+PROFILE_TOP_N = 15
+
+_class_profiles = defaultdict(list)
+
+def pytest_addoption(parser):
+    """Register the --profile option."""
+    parser.addoption(
+        '--profile',
+        action='store_true',
+        default=False,
+        help=f"Profile each test with cProfile and write stats to {PROFILE_DIR}/"
+    )
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Wrap each test call in cProfile when --profile is given."""
+    if not item.config.getoption('--profile'):
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        PROFILE_DIR.mkdir(exist_ok=True)
+        filename = PROFILE_DIR / (re.sub(r'[^\w.-]+', '_', item.nodeid) + '.prof')
+        profiler.dump_stats(filename)
+        _class_profiles[item.nodeid.rsplit('::', 1)[0]].append(str(filename))
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print the top cumulative-time entries for each test class."""
+    if not config.getoption('--profile'):
+        return
+
+    for group, filenames in sorted(_class_profiles.items()):
+        terminalreporter.write_sep('-', f"profile: {group}")
+        stats = pstats.Stats(*filenames, stream=terminalreporter)
+        stats.sort_stats('cumulative').print_stats(PROFILE_TOP_N)
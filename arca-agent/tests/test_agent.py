@@ -1,13 +1,17 @@
 import pytest
 import kopf
+import requests
 from unittest.mock import Mock, patch
 from kubernetes import client
+from tetrate import TetrateConnection
 from agent import (
     process_agentconfig,
     initialize_tetrate_connection,
     workspace_manager,
     handle_agentconfig,
-    watch_namespaces
+    watch_namespaces,
+    periodic_workspace_reconciliation,
+    AGENT_CONFIG_NAME
 )
 
 # Test data
@@ -61,6 +65,40 @@ class TestTetrateConnection:
         assert result is True
         mock_tetrate.assert_called_once()
 
+    @patch('agent.Organization')
+    @patch('agent.TetrateConnection')
+    def test_initialize_tetrate_connection_unchanged(self, mock_connection, mock_organization, monkeypatch):
+        """Test that an unchanged config does not reconnect."""
+        monkeypatch.setattr('agent._last_tetrate_hash', None)
+        config = {
+            'endpoint': 'https://test.example.com',
+            'apiToken': 'test-token'
+        }
+        assert initialize_tetrate_connection(config) is True
+        assert initialize_tetrate_connection(dict(config)) is True
+        mock_connection.assert_called_once()
+        mock_organization.return_value.get.assert_called_once()
+
+    @patch('agent.Organization')
+    def test_initialize_tetrate_connection_failed_keeps_previous(self, mock_organization, monkeypatch):
+        """Test that a config failing verification does not replace the verified connection."""
+        monkeypatch.setattr('agent._last_tetrate_hash', None)
+        monkeypatch.setattr(TetrateConnection, '_instance', None)
+        good = {'endpoint': 'https://good.example.com', 'apiToken': 'test-token'}
+        bad = {'endpoint': 'https://bad.example.com', 'apiToken': 'test-token'}
+
+        def verify():
+            if TetrateConnection.get_instance().endpoint == bad['endpoint']:
+                raise requests.exceptions.ConnectionError("unreachable")
+        mock_organization.return_value.get.side_effect = verify
+
+        assert initialize_tetrate_connection(good) is True
+        with pytest.raises(requests.exceptions.ConnectionError):
+            initialize_tetrate_connection(bad)
+        assert TetrateConnection.get_instance().endpoint == good['endpoint']
+        assert initialize_tetrate_connection(good) is True
+        assert TetrateConnection.get_instance().endpoint == good['endpoint']
+
     def test_initialize_tetrate_connection_invalid(self):
         """Test initializing Tetrate connection with invalid config."""
         config = {
@@ -144,4 +182,24 @@ class TestWorkspaceManager:
             workspace_manager(TEST_NAMESPACE)
             
         mock_workspace.assert_called_once()
-        mock_workspace_setting.assert_called_once() 
\ No newline at end of file
+        mock_workspace_setting.assert_called_once() 
+
+class TestPeriodicReconciliation:
+    @patch('agent.Organization')
+    @patch('agent.Tenant')
+    def test_workers_inherit_connection_override(self, mock_tenant, mock_organization):
+        """Workers see the connection bound with TetrateConnection.use() by the caller."""
+        namespaces = [Mock(metadata=Mock()) for _ in range(3)]
+        for i, ns in enumerate(namespaces):
+            ns.metadata.name = f"ns-{i}"
+        seen = []
+        override = Mock()
+        
+        with patch('agent.agent_config', {'discovery_label': TEST_LABEL}), \
+             patch('agent.core_v1_api') as mock_api, \
+             patch('agent.workspace_manager', side_effect=lambda *args: seen.append(TetrateConnection.get_instance())):
+            mock_api.list_namespace.return_value.items = namespaces
+            with TetrateConnection.use(override):
+                periodic_workspace_reconciliation({}, AGENT_CONFIG_NAME, Mock())
+        
+        assert seen == [override] * 3
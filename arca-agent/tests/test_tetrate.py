@@ -1,9 +1,10 @@
 import pytest
+import requests
 import responses
 from unittest.mock import Mock, patch
 from tetrate import (
     TetrateConnection, Organization, Tenant, Workspace, WorkspaceSetting,
-    recursive_merge
+    GatewayGroup, Gateway, recursive_merge, bulk_delete
 )
 
 # Test data
@@ -46,6 +47,16 @@ class TestTetrateConnection:
         conn2 = TetrateConnection.get_instance()
         assert conn1 is conn2
 
+    def test_use_overrides_singleton(self):
+        """Test that use() binds a connection only within its block."""
+        default = TetrateConnection(endpoint=TEST_ENDPOINT, api_token=TEST_TOKEN)
+        other = TetrateConnection(endpoint="https://other-tsb.example.com", api_token=TEST_TOKEN)
+        TetrateConnection._instance = default
+
+        with TetrateConnection.use(other):
+            assert TetrateConnection.get_instance() is other
+        assert TetrateConnection.get_instance() is default
+
     def test_headers_with_token(self):
         """Test header generation with API token."""
         conn = TetrateConnection(endpoint=TEST_ENDPOINT, api_token=TEST_TOKEN)
@@ -62,6 +73,13 @@ class TestTetrateConnection:
         headers = conn.get_headers()
         assert 'Basic' in headers['Authorization']
 
+    def test_missing_credentials(self, monkeypatch):
+        """Test that a connection without credentials fails at construction."""
+        for var in ('TETRATE_API_TOKEN', 'TETRATE_USERNAME', 'TETRATE_PASSWORD'):
+            monkeypatch.delenv(var, raising=False)
+        with pytest.raises(ValueError):
+            TetrateConnection(endpoint=TEST_ENDPOINT)
+
     @responses.activate
     def test_send_request(self, tetrate_connection):
         """Test send_request method."""
@@ -78,6 +96,37 @@ class TestTetrateConnection:
         response = tetrate_connection.send_request('GET', test_url)
         assert response == test_response
 
+    @responses.activate
+    def test_send_request_caches_get(self, tetrate_connection):
+        """Test that repeated GETs are cached until a write invalidates them."""
+        test_url = f"{TEST_ENDPOINT}/test"
+        test_response = {"status": "success"}
+
+        responses.add(responses.GET, test_url, json=test_response, status=200)
+        responses.add(responses.PUT, test_url, json=test_response, status=200)
+
+        assert tetrate_connection.send_request('GET', test_url) == test_response
+        assert tetrate_connection.send_request('GET', test_url) == test_response
+        assert len(responses.calls) == 1
+
+        tetrate_connection.send_request('PUT', test_url, test_response)
+        tetrate_connection.send_request('GET', test_url)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_send_request_revalidates_expired_get(self, tetrate_connection):
+        """Test that an expired cached GET is revalidated with If-None-Match."""
+        test_url = f"{TEST_ENDPOINT}/test"
+        test_response = {"status": "success"}
+
+        responses.add(responses.GET, test_url, json=test_response, status=200, headers={'ETag': '"v1"'})
+        responses.add(responses.GET, test_url, status=304)
+
+        assert tetrate_connection.send_request('GET', test_url) == test_response
+        tetrate_connection._cache_ttl = 1e-9  # Expire the cached entry
+        assert tetrate_connection.send_request('GET', test_url) == test_response
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+
 class TestRecursiveMerge:
     def test_merge_simple_dicts(self):
         """Test merging of simple dictionaries."""
@@ -93,6 +142,24 @@ class TestRecursiveMerge:
         recursive_merge(d1, d2)
         assert d1['namespaceSelector']['names'] == ['ns1', 'ns2', 'ns3']
 
+class TestTenant:
+    @responses.activate
+    def test_list_workspaces(self, tenant, workspace):
+        """Test listing workspaces once and reusing the result in Workspace.get."""
+        url = f"{TEST_ENDPOINT}/v2/organizations/{TEST_ORG}/tenants/{TEST_TENANT}/workspaces"
+        workspace_response = {
+            "fqn": f"organizations/{TEST_ORG}/tenants/{TEST_TENANT}/workspaces/{TEST_WORKSPACE}",
+            "etag": "current"
+        }
+
+        responses.add(responses.GET, url, json={"workspaces": [workspace_response]}, status=200)
+
+        workspaces = tenant.list_workspaces()
+        assert workspaces == {TEST_WORKSPACE: workspace_response}
+        assert workspace.get(prefetched=workspaces) == workspace_response
+        assert workspace.workspace_data == workspace_response
+        assert len(responses.calls) == 1
+
 class TestWorkspace:
     @responses.activate
     def test_create_workspace(self, workspace):
@@ -132,6 +199,76 @@ class TestWorkspace:
         response = workspace.update(description="Updated workspace")
         assert response == test_response
 
+    @responses.activate
+    def test_create_or_update_skips_get_with_etag(self, workspace):
+        """Test that a workspace holding an etag is updated without a GET."""
+        url = f"{TEST_ENDPOINT}/v2/organizations/{TEST_ORG}/tenants/{TEST_TENANT}/workspaces/{TEST_WORKSPACE}"
+        test_response = {"etag": "new", "description": "Updated workspace"}
+        workspace.workspace_data = {"etag": "old", "description": "Workspace"}
+
+        responses.add(responses.PUT, url, json=test_response, status=200)
+
+        response = workspace.create_or_update({"description": "Updated workspace"})
+        assert response == test_response
+        assert [call.request.method for call in responses.calls] == ['PUT']
+
+    @responses.activate
+    def test_create_or_update_skips_noop_update(self, workspace):
+        """Test that no PUT is sent when the workspace already matches."""
+        workspace.workspace_data = {"etag": "current", "description": "Workspace"}
+
+        response = workspace.create_or_update({"description": "Workspace"})
+        assert response == {"etag": "current", "description": "Workspace"}
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_create_or_update_retries_stale_etag(self, workspace):
+        """Test that a stale etag triggers one refetch and retry."""
+        url = f"{TEST_ENDPOINT}/v2/organizations/{TEST_ORG}/tenants/{TEST_TENANT}/workspaces/{TEST_WORKSPACE}"
+        test_response = {"etag": "newer", "description": "Updated workspace"}
+        workspace.workspace_data = {"etag": "stale"}
+
+        responses.add(responses.PUT, url, status=412)
+        responses.add(responses.GET, url, json={"etag": "fresh"}, status=200)
+        responses.add(responses.PUT, url, json=test_response, status=200)
+
+        response = workspace.create_or_update({"description": "Updated workspace"})
+        assert response == test_response
+        assert [call.request.method for call in responses.calls] == ['PUT', 'GET', 'PUT']
+
+    @responses.activate
+    def test_create_or_update_failed_put_keeps_held_state(self, workspace):
+        """Test that a failed PUT does not leave the desired data in the held workspace."""
+        url = f"{TEST_ENDPOINT}/v2/organizations/{TEST_ORG}/tenants/{TEST_TENANT}/workspaces/{TEST_WORKSPACE}"
+        test_response = {"etag": "e2", "description": "new"}
+        workspace.workspace_data = {"etag": "e1", "description": "old"}
+
+        responses.add(responses.PUT, url, status=400)
+        responses.add(responses.PUT, url, json=test_response, status=200)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            workspace.create_or_update({"description": "new"})
+        assert workspace.workspace_data == {"etag": "e1", "description": "old"}
+
+        assert workspace.create_or_update({"description": "new"}) == test_response
+        assert [call.request.method for call in responses.calls] == ['PUT', 'PUT']
+
+    def test_workspace_uses_slots(self, workspace):
+        """Test that resource objects carry no per-instance __dict__."""
+        assert not hasattr(workspace, '__dict__')
+
+    @responses.activate
+    def test_bulk_delete(self, tenant):
+        """Test deleting several workspaces concurrently."""
+        workspaces = [Workspace(tenant=tenant, name=f"{TEST_WORKSPACE}-{i}") for i in range(3)]
+        for ws in workspaces:
+            url = f"{TEST_ENDPOINT}/v2/organizations/{TEST_ORG}/tenants/{TEST_TENANT}/workspaces/{ws.name}"
+            responses.add(responses.DELETE, url, json={"name": ws.name}, status=200)
+
+        response = bulk_delete(workspaces)
+        assert response == [{"name": ws.name} for ws in workspaces]
+        assert len(responses.calls) == 3
+
 class TestWorkspaceSetting:
     @responses.activate
     def test_create_workspace_setting(self, workspace):
@@ -152,4 +289,21 @@ class TestWorkspaceSetting:
         )
         
         response = setting.create_or_update({"test": "data"})
-        assert response == test_response 
\ No newline at end of file
+        assert response == test_response
+
+class TestGateway:
+    @responses.activate
+    def test_create_or_update_retries_stale_cached_etag(self, workspace):
+        """Test that a conflict from a cached read triggers one refetch and retry."""
+        gateway = Gateway(group=GatewayGroup(workspace=workspace, name="test-group"), name="test-gateway")
+        url = f"{TEST_ENDPOINT}/v2/organizations/{TEST_ORG}/tenants/{TEST_TENANT}/workspaces/{TEST_WORKSPACE}/gatewaygroups/test-group/unifiedgateways/test-gateway"
+        test_response = {"etag": "newer", "gateway": {"http": []}}
+
+        responses.add(responses.GET, url, json={"etag": "stale", "gateway": {}}, status=200)
+        responses.add(responses.PUT, url, status=409)
+        responses.add(responses.GET, url, json={"etag": "fresh", "gateway": {}}, status=200)
+        responses.add(responses.PUT, url, json=test_response, status=200)
+
+        response = gateway.create_or_update({"gateway": {"http": []}})
+        assert response == test_response
+        assert [call.request.method for call in responses.calls] == ['GET', 'PUT', 'GET', 'PUT']
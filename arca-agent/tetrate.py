@@ -1,32 +1,109 @@
 import os
+import copy
+import json
+import functools
+import time
+import base64
+import threading
 import requests
+import urllib3
 import logging
-from dataclasses import dataclass
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+# Environment settings read once at import time
+_DEFAULT_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
+_LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG').upper()
+
+def json_dumps(data):
+    """Serialize data to JSON bytes."""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def json_loads(content):
+    """Deserialize JSON bytes or str."""
+    if orjson:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def json_canonical(data):
+    """Serialize data to JSON bytes with sorted keys, for equality checks."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True).encode()
 
 def configure_logging():
     """Configure the logging for the script."""
-    log_level = os.getenv('LOG_LEVEL', 'DEBUG').upper()
     logger = logging.getLogger('arca-agent')
     if not logger.handlers:
         handler = logging.StreamHandler()
         formatter = logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s')
         handler.setFormatter(formatter)
         logger.addHandler(handler)
-        logger.setLevel(log_level)
+        logger.setLevel(_LOG_LEVEL)
     return logger
 
 logger = configure_logging()
 
+# Connection bound with TetrateConnection.use(); takes precedence over the singleton
+_current_connection = ContextVar('tetrate_connection', default=None)
+
+class SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter that hands one prebuilt SSLContext to every connection pool."""
+
+    def __init__(self, ssl_context, **kwargs):
+        # Set before super().__init__(), which builds the pool manager
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs['ssl_context'] = self.ssl_context
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    def send(self, request, verify=True, **kwargs):
+        # The prebuilt context decides which CAs are trusted. A CA path here (e.g. from
+        # REQUESTS_CA_BUNDLE) would make urllib3 load it into the shared context on every
+        # new connection, so only pass on whether to verify. Needs requests >= 2.32, which
+        # otherwise loads nothing into a pool's own context when verify is True.
+        return super().send(request, verify=bool(verify), **kwargs)
+
 class TetrateConnection:
     """Class to manage Tetrate connection and authentication."""
     _instance = None  # Class variable to store the singleton instance
 
     @classmethod
     def get_instance(cls):
-        """Get the singleton instance of TetrateConnection."""
-        if cls._instance is None:
+        """Get the connection bound with use(), falling back to the singleton instance."""
+        instance = _current_connection.get() or cls._instance
+        if instance is None:
             raise ValueError("TetrateConnection not initialized")
-        return cls._instance
+        return instance
+
+    @classmethod
+    @contextmanager
+    def use(cls, connection):
+        """Bind connection as the active TetrateConnection for the current context."""
+        token = _current_connection.set(connection)
+        try:
+            yield connection
+        finally:
+            _current_connection.reset(token)
 
     def __init__(self, endpoint=None, api_token=None, username=None, password=None, organization=None, tenant=None):
         self.endpoint = endpoint or os.getenv('TETRATE_ENDPOINT', 'https://your-tsb-server.com')
@@ -35,123 +112,350 @@ class TetrateConnection:
         self.password = password or os.getenv('TETRATE_PASSWORD')
         self.organization = organization or os.getenv('TETRATE_ORGANIZATION', 'tetrate')
         self.tenant = tenant or os.getenv('TETRATE_TENANT', 'arca')
-        
-        # Set this instance as the singleton instance
-        TetrateConnection._instance = self
 
-    def get_headers(self):
-        """Construct HTTP headers with appropriate authentication."""
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        # Credentials never change for a connection, so build the auth header once
+        # and fail at construction rather than on the first request
         if self.username and self.password:
-            import base64
             credentials = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
-            headers['Authorization'] = f'Basic {credentials}'
+            auth_header = f'Basic {credentials}'
         elif self.api_token:
-            headers['Authorization'] = f'Bearer {self.api_token}'
+            auth_header = f'Bearer {self.api_token}'
         else:
             logger.error("Authentication credentials are missing.")
             raise ValueError("Authentication credentials must be provided.")
-        return headers
+        # Shared by every caller of get_headers(), so expose it read-only
+        self._headers = MappingProxyType({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Authorization': auth_header
+        })
+
+        # Persistent session so TCP/TLS connections to TSB are reused across calls.
+        # 500 is left out of status_forcelist: TSB uses it to report concurrent
+        # modifications, which callers handle by re-reading the resource.
+        self._session = requests.Session()
+        # Each of the agent's ARCA_WORKERS reconcile threads can have two requests in flight
+        pool_maxsize = 2 * int(os.getenv('ARCA_WORKERS', '10'))
+        # POST is left out of allowed_methods so a create is never replayed.
+        retries = Retry(
+            total=5,
+            connect=3,
+            read=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({'GET', 'PUT', 'DELETE'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # Verify TLS against TETRATE_CA_BUNDLE when set; otherwise verification stays disabled.
+        # Either way the SSLContext is built once here and shared by every pooled connection.
+        ca_bundle = os.getenv('TETRATE_CA_BUNDLE')
+        if ca_bundle:
+            ssl_context = ssl.create_default_context(cafile=ca_bundle)
+        else:
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        self._verify = bool(ca_bundle)
+        # pool_block is left off: requests gives no pool timeout, so a thread waiting on a
+        # full pool would never wake once a replaced connection's session is closed
+        adapter = SSLContextAdapter(
+            ssl_context,
+            pool_connections=10,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update(self._headers)
+        self._session.verify = self._verify
+
+        # Short-lived cache of (fetched_at, raw body, ETag header) for GETs keyed by URL;
+        # expired entries are revalidated with If-None-Match. ARCA_CACHE_TTL=0 disables it.
+        self._cache = {}
+        self._cache_ttl = int(os.getenv('ARCA_CACHE_TTL', '30'))
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Set this instance as the singleton instance
+        TetrateConnection._instance = self
+
+    def get_headers(self):
+        """Return the read-only HTTP headers with appropriate authentication."""
+        return self._headers
 
     def send_request(self, method, url, data=None, timeout=None):
         """Helper function to send HTTP requests and handle common exceptions."""
-        timeout = timeout or int(os.getenv('REQUEST_TIMEOUT', '30'))
+        timeout = timeout or _DEFAULT_TIMEOUT
+        use_cache = method == 'GET' and self._cache_ttl > 0
+        cached = None
+        headers = None
+        if use_cache:
+            cached = self._cache.get(url)
+            if cached and time.monotonic() - cached[0] < self._cache_ttl:
+                self._cache_hits += 1
+                logger.debug("Cache hit for %s (hits=%s, misses=%s)", url, self._cache_hits, self._cache_misses)
+                # Decode on every hit so callers always get a dict they are free to mutate
+                return json_loads(cached[1]) if cached[1] else None
+            self._cache_misses += 1
+            if cached and cached[2]:
+                # Expired but validatable: let the server answer 304 instead of resending the body
+                headers = {'If-None-Match': cached[2]}
         response = None
         try:
-            response = requests.request(
+            response = self._session.request(
                 method,
                 url,
-                headers=self.get_headers(),
-                json=data,
+                headers=headers,
+                data=json_dumps(data) if data is not None else None,
                 timeout=timeout,
-                verify=False  # Note: SSL verification is disabled; enable it in production
+                # Passed per call so that, with verification off, REQUESTS_CA_BUNDLE cannot
+                # override session.verify; when it is on, SSLContextAdapter.send ignores the bundle
+                verify=self._verify
             )
             response.raise_for_status()
-            return response.json() if response.content else None
+            content = response.content
+            if use_cache:
+                etag = response.headers.get('ETag')
+                if response.status_code == 304 and cached:
+                    logger.debug("Cached response for %s is still current", url)
+                    content = cached[1]
+                    etag = etag or cached[2]
+                with self._cache_lock:
+                    self._cache[url] = (time.monotonic(), content, etag)
+            return json_loads(content) if content else None
         except requests.exceptions.Timeout:
-            logger.error(f"Request to {url} timed out.")
+            logger.error("Request to %s timed out.", url)
             raise
         except requests.exceptions.HTTPError as http_err:
             if response is not None:
-                logger.error(f"HTTP error occurred: {http_err} - Response: {response.text}")
+                logger.error("HTTP error occurred: %s - Response: %s", http_err, response.text)
             else:
-                logger.error(f"HTTP error occurred: {http_err} - No response received.")
+                logger.error("HTTP error occurred: %s - No response received.", http_err)
             raise
         except requests.exceptions.RequestException as req_err:
-            logger.error(f"Request exception occurred: {req_err}")
+            logger.error("Request exception occurred: %s", req_err)
             raise
         except Exception as err:
-            logger.exception(f"An unexpected error occurred: {err}")
+            logger.exception("An unexpected error occurred: %s", err)
             raise
+        finally:
+            # Writes, successful or not, make cached reads of the resource stale
+            if method != 'GET':
+                self._invalidate(url)
+
+    def _invalidate(self, url):
+        """Drop cached GETs for url, its sub-resources and its parent collection."""
+        collection = url.rsplit('/', 1)[0]
+        with self._cache_lock:
+            for key in [key for key in self._cache if key == collection or key.startswith(url)]:
+                del self._cache[key]
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
 
 def recursive_merge(d1, d2):
     """
-    Recursively merge d2 into d1. Values in d2 will overwrite those in d1.
-    Special handling for namespaceSelector.names to combine lists.
+    Merge d2 into d1 in place. Values in d2 will overwrite those in d1.
+    Nested 'names' lists (e.g. namespaceSelector.names) are combined,
+    keeping existing entries first and skipping duplicates.
     """
-    for key in d2:
-        # Special handling for namespaceSelector.names
-        if key == 'namespaceSelector' and isinstance(d1.get(key), dict) and isinstance(d2[key], dict):
-            if 'names' not in d1[key]:
-                d1[key]['names'] = []
-            if 'names' in d2[key]:
-                # Get existing and new names
-                existing_names = d1[key]['names']
-                new_names = d2[key]['names']
-                
-                # Combine lists while preserving both existing and new entries
-                all_names = existing_names.copy()  # Start with existing names
-                for name in new_names:
-                    if name not in all_names:  # Only add if not already present
-                        all_names.append(name)
-                
-                # Update the names list
-                d1[key]['names'] = all_names
+    # Walk the nested dicts with an explicit stack instead of recursion
+    stack = [(d1, d2)]
+    while stack:
+        a, b = stack.pop()
+        for key, value in b.items():
+            current = a.get(key)
+            # Exact type checks: merged data is plain decoded JSON, and type() is cheaper than isinstance()
+            if type(current) is dict and type(value) is dict:
+                stack.append((current, value))
+            elif key == 'names' and type(current) is list and type(value) is list:
+                seen = set(current)
+                for name in value:
+                    if name not in seen:
+                        seen.add(name)
+                        current.append(name)
+            else:
+                a[key] = value
+
+def is_conflict(err):
+    """Return True if an HTTPError means the etag we sent was stale."""
+    response = err.response
+    if response is None:
+        return False
+    return response.status_code in (409, 412) or (
+        response.status_code == 500 and "the resource has already been modified" in response.text
+    )
+
+def _map_concurrently(fn, items, max_workers):
+    """Call fn on each item from a thread pool, keeping the caller's context (and connection)."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(copy_context().run, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+def bulk_delete(resources, max_workers=8):
+    """Delete resources concurrently, returning their responses in order."""
+    return _map_concurrently(lambda resource: resource.delete(), resources, max_workers)
+
+def bulk_create_or_update(resources, desired_data, max_workers=8):
+    """Create or update resources concurrently from desired data keyed by resource name."""
+    return _map_concurrently(
+        lambda resource: resource.create_or_update(desired_data[resource.name]), resources, max_workers
+    )
+
+def _put_merged(resource, kind, existing, desired_data, merge_key=None):
+    """Merge desired data into a copy of an existing resource and PUT it, unless nothing changed.
+
+    With merge_key, desired data is only merged into existing data that has that key and
+    replaces it otherwise. The resource's held state changes only through resource._store(),
+    with the server's response or with existing data that already matched.
+    """
+    tetrate = TetrateConnection.get_instance()
+    
+    # Get the etag from the existing resource
+    etag = existing.get('etag')
+    
+    # Merge into a copy: existing may be our held state, which only changes once a PUT succeeds
+    if merge_key is None or merge_key in existing:
+        merged_data = copy.deepcopy(existing)
+        recursive_merge(merged_data, desired_data)
+        
+        # Nothing to send if the merge did not change anything
+        if json_canonical(merged_data) == json_canonical(existing):
+            logger.debug("%s %s is up to date, skipping update", kind.capitalize(), resource.name)
+            resource._store(existing)
+            return existing
+    else:
+        # Copied so adding the etag leaves the caller's dict alone
+        merged_data = dict(desired_data)
+    
+    # Preserve the etag
+    if etag:
+        merged_data['etag'] = etag
+    
+    logger.debug("Updating %s with merged data: %s", kind, merged_data)
+    
+    url = f'{tetrate.endpoint}{resource._path}'
+    logger.info("Updating %s: %s", kind, resource.name)
+    response = tetrate.send_request('PUT', url, merged_data)
+    resource._store(response)
+    return response
+
+def _create_or_update(resource, kind, payload_key, held, desired_data, attempts=2, merge_key=None):
+    """Create a resource, or merge desired data into it, retrying stale etags against a fresh GET.
+
+    held is the last full response kept for the resource; when it carries an etag the initial
+    GET is skipped. New resources are POSTed as {'name': ..., payload_key: desired_data}.
+    """
+    tetrate = TetrateConnection.get_instance()
+    base_url = f'{tetrate.endpoint}{resource._collection_path}'
+    
+    try:
+        # Skip the GET when we already hold the resource with its etag
+        existing = held if held and held.get('etag') else resource.get()
+        
+        if not existing:
+            logger.info("Creating new %s: %s", kind, resource.name)
+            payload = {
+                'name': resource.name,
+                payload_key: desired_data
+            }
+            logger.debug("Create payload: %s", payload)
+            response = tetrate.send_request('POST', base_url, payload)
+            resource._store(response)
+            return response
+        
+        for attempt in range(1, attempts + 1):
+            try:
+                return _put_merged(resource, kind, existing, desired_data, merge_key)
+            except requests.exceptions.HTTPError as e:
+                if not is_conflict(e) or attempt == attempts:
+                    raise
+                # Our etag was stale, retry against a fresh copy
+                logger.warning("%s %s was modified concurrently, retrying with fresh data (%s/%s)",
+                               kind.capitalize(), resource.name, attempt, attempts - 1)
+                existing = resource.get()
+                if not existing:
+                    raise
                 
-                # Handle other namespaceSelector fields
-                for subkey in d2[key]:
-                    if subkey != 'names':
-                        d1[key][subkey] = d2[key][subkey]
-        # Regular recursive merge for other keys
-        elif isinstance(d1.get(key), dict) and isinstance(d2[key], dict):
-            recursive_merge(d1[key], d2[key])
-        else:
-            d1[key] = d2[key]
+    except Exception as e:
+        logger.error("Error managing %s %s: %s", kind, resource.name, e)
+        raise
 
-@dataclass
+# Bounded: workspace names follow namespaces, which come and go over a long-running agent's life
+_PATH_CACHE_SIZE = 1024
+
+@functools.lru_cache(maxsize=_PATH_CACHE_SIZE)
+def _organization_path(organization):
+    """Return the TSB API path of an organization."""
+    return f'/v2/organizations/{organization}'
+
+@functools.lru_cache(maxsize=_PATH_CACHE_SIZE)
+def _tenant_path(organization, tenant):
+    """Return the TSB API path of a tenant."""
+    return f'{_organization_path(organization)}/tenants/{tenant}'
+
+@functools.lru_cache(maxsize=_PATH_CACHE_SIZE)
+def _workspace_path(organization, tenant, workspace):
+    """Return the TSB API path of a workspace."""
+    return f'{_tenant_path(organization, tenant)}/workspaces/{workspace}'
+
+@dataclass(slots=True)
 class Organization:
     """Class representing a TSB Organization."""
     name: str
+    _path: str = field(default='', init=False, repr=False)
+
+    def __post_init__(self):
+        self._path = _organization_path(self.name)
 
     def get(self):
         """Retrieve organization details from the TSB API."""
         tetrate = TetrateConnection.get_instance()
-        url = f'{tetrate.endpoint}/v2/organizations/{self.name}'
+        url = f'{tetrate.endpoint}{self._path}'
         return tetrate.send_request('GET', url)
 
-@dataclass
+@dataclass(slots=True)
 class Tenant:
     """Class representing a TSB Tenant within an Organization."""
     organization: Organization
     name: str
+    _path: str = field(default='', init=False, repr=False)
+
+    def __post_init__(self):
+        self._path = _tenant_path(self.organization.name, self.name)
 
     def get(self):
         """Retrieve tenant details from the TSB API."""
         tetrate = TetrateConnection.get_instance()
-        url = f'{tetrate.endpoint}/v2/organizations/{self.organization.name}/tenants/{self.name}'
+        url = f'{tetrate.endpoint}{self._path}'
         return tetrate.send_request('GET', url)
 
-@dataclass
+    def list_workspaces(self):
+        """List all workspaces of the tenant in one call, keyed by workspace name."""
+        tetrate = TetrateConnection.get_instance()
+        url = f'{tetrate.endpoint}{self._path}/workspaces'
+        response = tetrate.send_request('GET', url) or {}
+        return {
+            workspace.get('name') or workspace.get('fqn', '').rsplit('/', 1)[-1]: workspace
+            for workspace in response.get('workspaces', [])
+        }
+
+@dataclass(slots=True)
 class Workspace:
     """Class representing a TSB Workspace within a Tenant."""
     tenant: Tenant
     name: str
     workspace_data: dict = None
+    _path: str = field(default='', init=False, repr=False)
+    _collection_path: str = field(default='', init=False, repr=False)
 
     def __post_init__(self):
+        self._path = _workspace_path(self.tenant.organization.name, self.tenant.name, self.name)
+        self._collection_path = self._path.rsplit('/', 1)[0]
         if self.workspace_data is None:
             self.workspace_data = {
                 'namespaceSelector': {'names': []},
@@ -160,13 +464,19 @@ class Workspace:
                 }
             }
 
-    def get(self):
-        """Get workspace details."""
+    def get(self, prefetched=None):
+        """Get workspace details, from a Tenant.list_workspaces() result if one is given."""
+        if prefetched is not None:
+            response = prefetched.get(self.name)
+            if response is not None:
+                self._store(response)
+            return response
+        
         tetrate = TetrateConnection.get_instance()
-        url = f'{tetrate.endpoint}/v2/organizations/{self.tenant.organization.name}/tenants/{self.tenant.name}/workspaces/{self.name}'
+        url = f'{tetrate.endpoint}{self._path}'
         try:
             response = tetrate.send_request('GET', url)
-            self.workspace_data = response
+            self._store(response)
             return response
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -175,155 +485,77 @@ class Workspace:
 
     def create_or_update(self, desired_data: dict):
         """Create or update workspace with given data."""
-        tetrate = TetrateConnection.get_instance()
-        base_url = f'{tetrate.endpoint}/v2/organizations/{self.tenant.organization.name}/tenants/{self.tenant.name}/workspaces'
-        
-        try:
-            # Try to get existing workspace
-            existing = self.get()
-            
-            if existing:
-                # Get the etag from existing workspace
-                etag = existing.get('etag')
-                
-                # Merge existing with desired data
-                merged_data = existing.copy()
-                recursive_merge(merged_data, desired_data)
-                
-                # Preserve the etag
-                if etag:
-                    merged_data['etag'] = etag
-                
-                logger.debug(f"Updating workspace with merged data: {merged_data}")
-                
-                # Update existing workspace
-                url = f"{base_url}/{self.name}"
-                logger.info(f"Updating workspace: {self.name}")
-                response = tetrate.send_request('PUT', url, merged_data)
-                self.workspace_data = response
-                return response
-            else:
-                # Create new workspace
-                logger.info(f"Creating new workspace: {self.name}")
-                payload = {
-                    'name': self.name,
-                    'workspace': desired_data
-                }
-                logger.debug(f"Create payload: {payload}")
-                response = tetrate.send_request('POST', base_url, payload)
-                self.workspace_data = response
-                return response
-                
-        except Exception as e:
-            logger.error(f"Error managing workspace {self.name}: {str(e)}")
-            raise
+        return _create_or_update(self, 'workspace', 'workspace', self.workspace_data, desired_data)
+
+    def _store(self, response):
+        self.workspace_data = response
 
     def delete(self):
         """Delete the workspace."""
         tetrate = TetrateConnection.get_instance()
-        url = f'{tetrate.endpoint}/v2/organizations/{self.tenant.organization.name}/tenants/{self.tenant.name}/workspaces/{self.name}'
-        logger.info(f"Deleting workspace: {self.name}")
+        url = f'{tetrate.endpoint}{self._path}'
+        logger.info("Deleting workspace: %s", self.name)
         return tetrate.send_request('DELETE', url)
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceSetting:
     """Class representing a TSB WorkspaceSetting within a Workspace."""
     workspace: Workspace
     name: str
     setting_data: dict = None
     max_retries: int = 3
+    _path: str = field(default='', init=False, repr=False)
+    _collection_path: str = field(default='', init=False, repr=False)
     
     def __post_init__(self):
+        self._collection_path = f'{self.workspace._path}/settings'
+        self._path = f'{self._collection_path}/{self.name}'
         if self.setting_data is None:
             self.setting_data = {}
 
     def get(self):
         """Get workspace setting details."""
         tetrate = TetrateConnection.get_instance()
-        url = (f'{tetrate.endpoint}/v2/organizations/{self.workspace.tenant.organization.name}/'
-               f'tenants/{self.workspace.tenant.name}/workspaces/{self.workspace.name}/settings/{self.name}')
+        url = f'{tetrate.endpoint}{self._path}'
         try:
             response = tetrate.send_request('GET', url)
-            self.setting_data = response
+            self._store(response)
             return response
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 return None
             raise
 
-    def create_or_update(self, desired_settings: dict, retry_count=0):
+    def create_or_update(self, desired_settings: dict):
         """Create or update workspace setting with given settings."""
-        if retry_count >= self.max_retries:
-            raise Exception(f"Max retries ({self.max_retries}) exceeded while trying to update workspace settings")
-            
-        tetrate = TetrateConnection.get_instance()
-        base_url = (f'{tetrate.endpoint}/v2/organizations/{self.workspace.tenant.organization.name}/'
-                   f'tenants/{self.workspace.tenant.name}/workspaces/{self.workspace.name}/settings')
-        
-        try:
-            # Try to get existing settings
-            existing = self.get()
-            
-            if existing:
-                # Get the etag from existing settings
-                etag = existing.get('etag')
-                
-                # Merge existing with desired settings
-                merged_settings = existing.copy()  # Copy the entire response
-                if 'settings' in merged_settings:
-                    recursive_merge(merged_settings, desired_settings)
-                else:
-                    merged_settings = desired_settings
-                
-                # Preserve the etag
-                if etag:
-                    merged_settings['etag'] = etag
-                
-                logger.debug(f"Updating with merged settings: {merged_settings}")
-                
-                # Update existing settings
-                url = f"{base_url}/{self.name}"
-                logger.info(f"Updating workspace setting: {self.name}")
-                logger.debug(f"Update payload: {merged_settings}")
-                response = tetrate.send_request('PUT', url, merged_settings)
-                self.setting_data = response
-                return response
-            else:
-                # Create new settings
-                logger.info(f"Creating new workspace setting: {self.name}")
-                logger.debug(f"Update payload: {desired_settings}")
-                payload = {
-                    'name': self.name,
-                    'settings': desired_settings
-                }
-                logger.debug(f"Create payload: {payload}")
-                response = tetrate.send_request('POST', base_url, payload)
-                self.setting_data = response
-                return response
-                
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 500 and "the resource has already been modified" in str(e.response.text):
-                # Resource was modified, retry with fresh data
-                logger.warning(f"Concurrent modification detected, retrying ({retry_count + 1}/{self.max_retries})")
-                return self.create_or_update(desired_settings, retry_count + 1)
-            raise
+        # Transient 5xx errors are retried by the session; only stale etags need a fresh GET here
+        return _create_or_update(self, 'workspace setting', 'settings', self.setting_data, desired_settings,
+                                 attempts=self.max_retries, merge_key='settings')
+
+    def _store(self, response):
+        self.setting_data = response
 
     def delete(self):
         """Delete the workspace setting."""
         tetrate = TetrateConnection.get_instance()
-        url = (f'{tetrate.endpoint}/v2/organizations/{self.workspace.tenant.organization.name}/'
-               f'tenants/{self.workspace.tenant.name}/workspaces/{self.workspace.name}/settings/{self.name}')
-        logger.info(f"Deleting workspace setting: {self.name}")
+        url = f'{tetrate.endpoint}{self._path}'
+        logger.info("Deleting workspace setting: %s", self.name)
         return tetrate.send_request('DELETE', url)
 
-@dataclass
+@dataclass(slots=True)
 class GatewayGroup:
     """Class representing a TSB Gateway Group within a Workspace."""
     workspace: Workspace
     name: str
     group_data: dict = None
+    # Last full API response, including the etag that group_data does not carry
+    _response: dict = field(default=None, init=False, repr=False)
+    _path: str = field(default='', init=False, repr=False)
+    _collection_path: str = field(default='', init=False, repr=False)
 
     def __post_init__(self):
+        self._collection_path = f'{self.workspace._path}/gatewaygroups'
+        self._path = f'{self._collection_path}/{self.name}'
         if self.group_data is None:
             self.group_data = {
                 'configMode': 'BRIDGED',
@@ -340,11 +572,10 @@ class GatewayGroup:
     def get(self):
         """Get gateway group details."""
         tetrate = TetrateConnection.get_instance()
-        url = (f'{tetrate.endpoint}/v2/organizations/{self.workspace.tenant.organization.name}/'
-               f'tenants/{self.workspace.tenant.name}/workspaces/{self.workspace.name}/gatewaygroups/{self.name}')
+        url = f'{tetrate.endpoint}{self._path}'
         try:
             response = tetrate.send_request('GET', url)
-            self.group_data = response.get('group', {})
+            self._store(response)
             return response
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -353,66 +584,31 @@ class GatewayGroup:
 
     def create_or_update(self, desired_data: dict):
         """Create or update gateway group with given data."""
-        tetrate = TetrateConnection.get_instance()
-        base_url = (f'{tetrate.endpoint}/v2/organizations/{self.workspace.tenant.organization.name}/'
-                   f'tenants/{self.workspace.tenant.name}/workspaces/{self.workspace.name}/gatewaygroups')
-        
-        try:
-            # Try to get existing group
-            existing = self.get()
-            
-            if existing:
-                # Get the etag from existing group
-                etag = existing.get('etag')
-                
-                # Merge existing with desired data
-                merged_data = existing.copy()
-                recursive_merge(merged_data, desired_data)
-                
-                # Preserve the etag
-                if etag:
-                    merged_data['etag'] = etag
-                
-                logger.debug(f"Updating gateway group with merged data: {merged_data}")
-                
-                # Update existing group
-                url = f"{base_url}/{self.name}"
-                logger.info(f"Updating gateway group: {self.name}")
-                response = tetrate.send_request('PUT', url, merged_data)
-                self.group_data = response.get('group', {})
-                return response
-            else:
-                # Create new gateway group
-                logger.info(f"Creating new gateway group: {self.name}")
-                payload = {
-                    'name': self.name,
-                    'group': desired_data
-                }
-                logger.debug(f"Create payload: {payload}")
-                response = tetrate.send_request('POST', base_url, payload)
-                self.group_data = response.get('group', {})
-                return response
-                
-        except Exception as e:
-            logger.error(f"Error managing gateway group {self.name}: {str(e)}")
-            raise
+        return _create_or_update(self, 'gateway group', 'group', self._response, desired_data)
+
+    def _store(self, response):
+        self._response = response
+        self.group_data = response.get('group', {})
 
     def delete(self):
         """Delete the gateway group."""
         tetrate = TetrateConnection.get_instance()
-        url = (f'{tetrate.endpoint}/v2/organizations/{self.workspace.tenant.organization.name}/'
-               f'tenants/{self.workspace.tenant.name}/workspaces/{self.workspace.name}/gatewaygroups/{self.name}')
-        logger.info(f"Deleting gateway group: {self.name}")
+        url = f'{tetrate.endpoint}{self._path}'
+        logger.info("Deleting gateway group: %s", self.name)
         return tetrate.send_request('DELETE', url)
 
-@dataclass
+@dataclass(slots=True)
 class Gateway:
     """Class representing a TSB Gateway within a GatewayGroup."""
     group: GatewayGroup
     name: str
     gateway_data: dict = None
+    _path: str = field(default='', init=False, repr=False)
+    _collection_path: str = field(default='', init=False, repr=False)
 
     def __post_init__(self):
+        self._collection_path = f'{self.group._path}/unifiedgateways'
+        self._path = f'{self._collection_path}/{self.name}'
         if self.gateway_data is None:
             self.gateway_data = {
                 'workloadSelector': {
@@ -431,12 +627,10 @@ class Gateway:
     def get(self):
         """Get gateway details."""
         tetrate = TetrateConnection.get_instance()
-        url = (f'{tetrate.endpoint}/v2/organizations/{self.group.workspace.tenant.organization.name}/'
-               f'tenants/{self.group.workspace.tenant.name}/workspaces/{self.group.workspace.name}/'
-               f'gatewaygroups/{self.group.name}/unifiedgateways/{self.name}')
+        url = f'{tetrate.endpoint}{self._path}'
         try:
             response = tetrate.send_request('GET', url)
-            self.gateway_data = response.get('gateway', {})
+            self._store(response)
             return response
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -445,96 +639,15 @@ class Gateway:
 
     def create_or_update(self, desired_data: dict):
         """Create or update gateway with given data."""
-        tetrate = TetrateConnection.get_instance()
-        base_url = (f'{tetrate.endpoint}/v2/organizations/{self.group.workspace.tenant.organization.name}/'
-                   f'tenants/{self.group.workspace.tenant.name}/workspaces/{self.group.workspace.name}/'
-                   f'gatewaygroups/{self.group.name}/unifiedgateways')
-        
-        try:
-            # Try to get existing gateway
-            existing = self.get()
-            
-            if existing:
-                # Get the etag from existing gateway
-                etag = existing.get('etag')
-                
-                # Merge existing with desired data
-                merged_data = existing.copy()
-                recursive_merge(merged_data, desired_data)
-                
-                # Preserve the etag
-                if etag:
-                    merged_data['etag'] = etag
-                
-                logger.debug(f"Updating gateway with merged data: {merged_data}")
-                
-                # Update existing gateway
-                url = f"{base_url}/{self.name}"
-                logger.info(f"Updating gateway: {self.name}")
-                response = tetrate.send_request('PUT', url, merged_data)
-                self.gateway_data = response.get('gateway', {})
-                return response
-            else:
-                # Create new gateway
-                logger.info(f"Creating new gateway: {self.name}")
-                payload = {
-                    'name': self.name,
-                    'gateway': desired_data
-                }
-                logger.debug(f"Create payload: {payload}")
-                response = tetrate.send_request('POST', base_url, payload)
-                self.gateway_data = response.get('gateway', {})
-                return response
-                
-        except Exception as e:
-            logger.error(f"Error managing gateway {self.name}: {str(e)}")
-            raise
+        # gateway_data carries no etag, so this always reads first; a stale cached read is retried
+        return _create_or_update(self, 'gateway', 'gateway', None, desired_data)
+
+    def _store(self, response):
+        self.gateway_data = response.get('gateway', {})
 
     def delete(self):
         """Delete the gateway."""
         tetrate = TetrateConnection.get_instance()
-        url = (f'{tetrate.endpoint}/v2/organizations/{self.group.workspace.tenant.organization.name}/'
-               f'tenants/{self.group.workspace.tenant.name}/workspaces/{self.group.workspace.name}/'
-               f'gatewaygroups/{self.group.name}/unifiedgateways/{self.name}')
-        logger.info(f"Deleting gateway: {self.name}")
+        url = f'{tetrate.endpoint}{self._path}'
+        logger.info("Deleting gateway: %s", self.name)
         return tetrate.send_request('DELETE', url)
-
-def test():
-    try:
-        # Create organization and tenant objects
-        organization = Organization(tetrate.organization)
-        tenant = Tenant(organization, tetrate.tenant)
-
-        # Get organization details
-        org_details = organization.get()
-        logger.info(f"Found organization: {org_details}")
-
-        # Get tenant details
-        tenant_details = tenant.get()
-        logger.info(f"Found existing tenant: {tenant_details}")
-
-        # Initialize the Workspace object
-        workspace = Workspace(tenant=tenant, name='my-workspace')
-        workspace.create()
-        # Get workspace details
-        workspace_details = workspace.get()
-        logger.info(f"Workspace details: {workspace_details}")
-
-        # Update the workspace with new properties
-        update_properties = {
-            'namespaceSelector': {'names': ['*/new-namespace']},
-            'configGenerationMetadata': {
-                'labels': {
-                    'arca.io/managed': 'true',
-                    'additional-label': 'value'
-                }
-            },
-            'description': 'Updated description'
-        }
-        workspace.update(**update_properties)
-        workspace.delete()
-        logger.info(f"Workspace updated successfully: {workspace.workspace_data}")
-
-    except Exception as e:
-        logger.exception('An error occurred')
-        sys.exit(1)
\ No newline at end of file
@@ -1,7 +1,12 @@
 import os
+import json
+import functools
+import time
+import threading
 import kopf
 from kubernetes import client, config as kube_config
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Configure logging
 log_level = os.getenv('LOG_LEVEL', 'DEBUG').upper()
@@ -21,14 +26,73 @@ except kube_config.ConfigException:
     kube_config.load_kube_config()
     logger.debug("Loaded local Kubernetes configuration.")
 
-# Create Kubernetes API client
-core_v1_api = client.CoreV1Api()
+# Kubernetes API clients, created on first use by the getters below
+_core_v1_api = None
+_custom_objects_api = None
+_api_lock = threading.Lock()
+
+def get_core_v1_api():
+    """Return the process-wide CoreV1Api, created on first use.
+
+    Its connection pool is sized for the kopf workers plus the namespace worker pool
+    (the client default of 4 would throttle them). Creation is locked because the first
+    calls come concurrently from the namespace worker threads.
+    """
+    global _core_v1_api
+    if _core_v1_api is None:
+        with _api_lock:
+            if _core_v1_api is None:
+                kube_configuration = client.Configuration.get_default_copy()
+                kube_configuration.connection_pool_maxsize = 32
+                client.Configuration.set_default(kube_configuration)
+                _core_v1_api = client.CoreV1Api(client.ApiClient(kube_configuration))
+    return _core_v1_api
+
+def get_custom_objects_api():
+    """Return the process-wide CustomObjectsApi, sharing the CoreV1Api connection pool."""
+    global _custom_objects_api
+    if _custom_objects_api is None:
+        api_client = get_core_v1_api().api_client
+        with _api_lock:
+            if _custom_objects_api is None:
+                _custom_objects_api = client.CustomObjectsApi(api_client)
+    return _custom_objects_api
 
 # Global variables
 manager_config = None
 
+# Local views of managed namespaces and gateways, kept current by the event handlers
+# below so reconciles can skip a GET for objects the watches have already seen
+_namespace_cache = {}  # namespace name -> {'labels': ..., 'annotations': ...}
+_gateway_cache = {}  # namespace name -> gateway spec
+_workspace_cache = {}  # namespace name -> (labels, annotations) wanted by its managed workspace
+
 MANAGER_CONFIG_NAME = "default"
 FINALIZER = 'operator.arca.io/manager-cleanup'
+FIELD_MANAGER = 'arca-manager'
+APPLY_CONTENT_TYPE = 'application/apply-patch+yaml'
+DEBOUNCE_SECONDS = 0.5
+RETRY_DELAY_SECONDS = 60
+
+# Gateway spec shared by every namespace. A plain dict because the Kubernetes client
+# only serializes dicts; it is shared between calls and must never be mutated.
+_GATEWAY_SPEC = {
+    "type": "UNIFIED",
+    "kubeSpec": {
+        "service": {
+            "type": "LoadBalancer",
+            "annotations": {
+                "traffic.istio.io/nodeSelector": '{"kubernetes.io/os": "linux"}'
+            }
+        }
+    }
+}
+_GATEWAY_SPEC_JSON = json.dumps(_GATEWAY_SPEC, sort_keys=True)
+
+# Workspace events coalesced per namespace (name -> (labels, annotations)), drained by _namespace_worker
+_pending = {}
+_pending_lock = threading.Lock()
+_pending_event = threading.Event()
 
 @kopf.on.startup()
 def configure(settings: kopf.OperatorSettings, **_):
@@ -36,11 +100,59 @@ def configure(settings: kopf.OperatorSettings, **_):
     settings.execution.max_workers = 10
     settings.persistence.finalizer = FINALIZER
     settings.posting.enabled = True
-    logger.debug(f"Operator settings configured with finalizer: {FINALIZER}")
+    threading.Thread(target=_namespace_worker, name='namespace-worker', daemon=True).start()
+    logger.debug("Operator settings configured with finalizer: %s", FINALIZER)
+
+def enqueue_namespace(name: str, labels: dict, annotations: dict):
+    """Queue a namespace for reconciliation, replacing any not yet processed request for it."""
+    with _pending_lock:
+        _pending[name] = (labels, annotations)
+    _pending_event.set()
+
+def _retry_namespace(name: str):
+    """Re-queue a failed namespace with its workspace's current metadata.
+
+    The retry is dropped when the workspace has been deleted since, and skipped when a newer
+    request for the namespace is already queued.
+    """
+    entry = _workspace_cache.get(name)
+    if entry is None:
+        logger.info("Workspace for namespace %s is gone, dropping its retry", name)
+        return
+    with _pending_lock:
+        if name in _pending:
+            logger.debug("Namespace %s is already queued, skipping its retry", name)
+            return
+        _pending[name] = entry
+    _pending_event.set()
+
+def _namespace_worker():
+    """Reconcile queued namespaces, collapsing bursts of events within DEBOUNCE_SECONDS."""
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        while True:
+            _pending_event.wait()
+            time.sleep(DEBOUNCE_SECONDS)
+            with _pending_lock:
+                batch = dict(_pending)
+                _pending.clear()
+                _pending_event.clear()
+            
+            futures = {
+                executor.submit(create_namespace, name, labels, annotations): name
+                for name, (labels, annotations) in batch.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    name = futures[future]
+                    logger.error("Failed to reconcile namespace %s, retrying in %ss: %s", name, RETRY_DELAY_SECONDS, e)
+                    # Only the name is carried: the retry reads whatever the workspace wants by then
+                    threading.Timer(RETRY_DELAY_SECONDS, _retry_namespace, args=(name,)).start()
 
 def process_managerconfig(spec: dict) -> dict:
     """Process ManagerConfig and return a structured configuration."""
-    logger.debug(f"Processing ManagerConfig spec: {spec}")
+    logger.debug("Processing ManagerConfig spec: %s", spec)
     config = {
         'discovery_label': spec.get('discoveryLabel'),
         'tetrate': spec.get('tetrate')
@@ -50,53 +162,63 @@ def process_managerconfig(spec: dict) -> dict:
         try:
             key, value = config['discovery_label'].split('=', 1)
             config.update({'discovery_key': key, 'discovery_value': value})
-            logger.debug(f"Parsed discovery label: key={key}, value={value}")
+            logger.debug("Parsed discovery label: key=%s, value=%s", key, value)
         except ValueError:
-            logger.error(f"Invalid discoveryLabel format: '{config['discovery_label']}'")
+            logger.error("Invalid discoveryLabel format: '%s'", config['discovery_label'])
             raise ValueError(f"Invalid discoveryLabel format: '{config['discovery_label']}'")
 
     return config
 
+@functools.lru_cache(maxsize=4096)
+def _intern_metadata(items: tuple) -> dict:
+    """Return one shared dict per distinct tuple of (key, value) items.
+
+    The returned dict is shared by every caller passing the same items and must be treated as read-only.
+    """
+    return dict(items)
+
+def _is_applied(existing: dict, desired: dict) -> bool:
+    """Check whether every desired key already has its desired value."""
+    return all(existing.get(key) == value for key, value in desired.items())
+
 def create_namespace(name: str, labels: dict = None, annotations: dict = None):
     """Create a namespace with given name and metadata."""
     try:
-        namespace = client.V1Namespace(
-            metadata=client.V1ObjectMeta(
-                name=name,
-                labels=labels or {},
-                annotations=annotations or {}
+        existing = _namespace_cache.get(name)
+        if (existing and _is_applied(existing['labels'], labels or {})
+                and _is_applied(existing['annotations'], annotations or {})):
+            logger.debug("Namespace %s metadata is up to date, skipping apply", name)
+        else:
+            # Server-side apply creates the namespace when missing and otherwise
+            # updates only the fields owned by arca-manager, in a single call
+            get_core_v1_api().patch_namespace(
+                name,
+                {
+                    "apiVersion": "v1",
+                    "kind": "Namespace",
+                    "metadata": {
+                        "name": name,
+                        "labels": labels or {},
+                        "annotations": annotations or {}
+                    }
+                },
+                field_manager=FIELD_MANAGER,
+                force=True,
+                _content_type=APPLY_CONTENT_TYPE
             )
-        )
-        
-        try:
-            core_v1_api.read_namespace(name)
-            logger.info(f"Namespace {name} already exists")
-            # Update labels and annotations if needed
-            core_v1_api.patch_namespace(name, {
-                "metadata": {
-                    "labels": labels or {},
-                    "annotations": annotations or {}
-                }
-            })
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                core_v1_api.create_namespace(namespace)
-                logger.info(f"Created namespace: {name}")
-            else:
-                raise
+            logger.info("Applied namespace: %s", name)
                 
         # Create application gateway for the namespace
         create_application_gateway(name)
                 
     except Exception as e:
-        logger.error(f"Error managing namespace {name}: {str(e)}")
+        logger.error("Error managing namespace %s: %s", name, e)
         raise
 
 def create_application_gateway(namespace_name: str):
     """Create an application gateway for the namespace."""
     try:
         # Create Gateway custom resource
-        api = client.CustomObjectsApi()
         gateway = {
             "apiVersion": "install.tetrate.io/v1alpha1",
             "kind": "Gateway",
@@ -108,83 +230,75 @@ def create_application_gateway(namespace_name: str):
                     "arca.io/namespace": namespace_name
                 }
             },
-            "spec": {
-                "type": "UNIFIED",
-                "kubeSpec": {
-                    "service": {
-                        "type": "LoadBalancer",
-                        "annotations": {
-                            "traffic.istio.io/nodeSelector": '{"kubernetes.io/os": "linux"}'
-                        }
-                    }
-                }
-            }
+            "spec": _GATEWAY_SPEC
         }
         
-        try:
-            # Try to get existing gateway
-            api.get_namespaced_custom_object(
-                group="install.tetrate.io",
-                version="v1alpha1",
-                namespace=namespace_name,
-                plural="gateways",
-                name=f"{namespace_name}-gateway"
-            )
-            logger.info(f"Gateway already exists in namespace {namespace_name}")
-            
-            # Update existing gateway
-            api.patch_namespaced_custom_object(
-                group="install.tetrate.io",
-                version="v1alpha1",
-                namespace=namespace_name,
-                plural="gateways",
-                name=f"{namespace_name}-gateway",
-                body=gateway
-            )
-            logger.info(f"Updated gateway in namespace {namespace_name}")
-            
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                # Create new gateway
-                api.create_namespaced_custom_object(
-                    group="install.tetrate.io",
-                    version="v1alpha1",
-                    namespace=namespace_name,
-                    plural="gateways",
-                    body=gateway
-                )
-                logger.info(f"Created gateway in namespace {namespace_name}")
-            else:
-                raise
+        existing_spec = _gateway_cache.get(namespace_name)
+        if existing_spec is not None and json.dumps(existing_spec, sort_keys=True) == _GATEWAY_SPEC_JSON:
+            logger.debug("Gateway in namespace %s is up to date, skipping apply", namespace_name)
+            return
+        
+        # Server-side apply creates or updates the gateway in a single call
+        get_custom_objects_api().patch_namespaced_custom_object(
+            group="install.tetrate.io",
+            version="v1alpha1",
+            namespace=namespace_name,
+            plural="gateways",
+            name=f"{namespace_name}-gateway",
+            body=gateway,
+            field_manager=FIELD_MANAGER,
+            force=True,
+            _content_type=APPLY_CONTENT_TYPE
+        )
+        logger.info("Applied gateway in namespace %s", namespace_name)
                 
     except Exception as e:
-        logger.error(f"Error managing gateway for namespace {namespace_name}: {str(e)}")
+        logger.error("Error managing gateway for namespace %s: %s", namespace_name, e)
         raise
 
+@kopf.on.event('', 'v1', 'namespaces')
+def watch_namespaces(event, name, meta, **kwargs):
+    """Keep the managed namespace cache in sync with the cluster."""
+    labels = meta.get('labels', {})
+    if event['type'] == 'DELETED' or labels.get('arca.io/managed') != 'true':
+        _namespace_cache.pop(name, None)
+        return
+    _namespace_cache[name] = {
+        'labels': dict(labels),
+        'annotations': dict(meta.get('annotations', {}))
+    }
+
+@kopf.on.event('install.tetrate.io', 'v1alpha1', 'gateways')
+def watch_gateways(event, name, namespace, meta, spec, **kwargs):
+    """Keep the managed gateway cache in sync with the cluster."""
+    if name != f"{namespace}-gateway" or meta.get('labels', {}).get('arca.io/managed') != 'true':
+        return
+    if event['type'] == 'DELETED':
+        _gateway_cache.pop(namespace, None)
+    else:
+        _gateway_cache[namespace] = dict(spec)
+
 @kopf.on.create('operator.arca.io', 'v1alpha1', 'managerconfigs')
 @kopf.on.update('operator.arca.io', 'v1alpha1', 'managerconfigs')
 @kopf.on.resume('operator.arca.io', 'v1alpha1', 'managerconfigs')
 def handle_managerconfig(spec, name, meta, status, **kwargs):
     """Handle creation and updates of ManagerConfig resources."""
     if name != MANAGER_CONFIG_NAME:
-        logger.warning(f"Ignoring ManagerConfig '{name}' as it's not the default name '{MANAGER_CONFIG_NAME}'")
+        logger.warning("Ignoring ManagerConfig '%s' as it's not the default name '%s'", name, MANAGER_CONFIG_NAME)
         return
 
     global manager_config
     try:
-        logger.debug(f"Handling ManagerConfig with spec: {spec}")
+        logger.debug("Handling ManagerConfig with spec: %s", spec)
         manager_config = process_managerconfig(spec)
         logger.info("Configuration updated for ManagerConfig")
     except Exception as e:
-        logger.error(f"Failed to process ManagerConfig: {str(e)}")
+        logger.error("Failed to process ManagerConfig: %s", e)
         raise kopf.PermanentError(f"Configuration failed: {str(e)}")
 
 @kopf.on.event('xcp.tetrate.io', 'v2', 'workspaces')
 def watch_workspaces(event, name, meta, spec, status, **kwargs):
     """Watch for Workspace events and create local namespaces."""
-    if not manager_config or not manager_config.get('discovery_label'):
-        return
-    
     try:
         # Check if workspace is managed by us
         workspace_labels = meta.get('labels', {})
@@ -195,28 +309,38 @@ def watch_workspaces(event, name, meta, spec, status, **kwargs):
             
         namespace_name = workspace_labels.get('arca.io/namespace')
         if not namespace_name:
-            logger.warning(f"Workspace {name} is missing arca.io/namespace label")
+            logger.warning("Workspace %s is missing arca.io/namespace label", name)
             return
             
         event_type = event['type']
-        logger.debug(f"Processing workspace event: {event_type} for {name}, namespace={namespace_name}")
+        if event_type == 'DELETED':
+            _workspace_cache.pop(namespace_name, None)
+            return
+        
+        # Interned, so identical label and annotation sets share one read-only dict
+        labels = _intern_metadata((
+            ('arca.io/managed', 'true'),
+            ('arca.io/workspace', name)
+        ))
+        
+        annotations = _intern_metadata((
+            ('arca.io/config-mode', annotations.get('tsb.tetrate.io/config-mode', '')),
+            ('arca.io/workspace-fqn', annotations.get('tsb.tetrate.io/fqn', ''))
+        ))
+        # Cached even before a ManagerConfig exists so the periodic sweep can pick it up later
+        _workspace_cache[namespace_name] = (labels, annotations)
+        
+        if not manager_config or not manager_config.get('discovery_label'):
+            return
+        
+        logger.debug("Processing workspace event: %s for %s, namespace=%s", event_type, name, namespace_name)
         
         if event_type in ['ADDED', 'MODIFIED']:
             # Create or update namespace
-            labels = {
-                'arca.io/managed': 'true',
-                'arca.io/workspace': name
-            }
-            
-            annotations = {
-                'arca.io/workspace-fqn': annotations.get('tsb.tetrate.io/fqn', ''),
-                'arca.io/config-mode': annotations.get('tsb.tetrate.io/config-mode', '')
-            }
-            
-            create_namespace(namespace_name, labels, annotations)
+            enqueue_namespace(namespace_name, labels, annotations)
             
     except Exception as e:
-        logger.error(f"Error processing workspace {name}: {str(e)}")
+        logger.error("Error processing workspace %s: %s", name, e)
         raise kopf.TemporaryError(f"Failed to process workspace: {str(e)}", delay=60)
 
 @kopf.timer('operator.arca.io', 'v1alpha1', 'managerconfigs',
@@ -234,26 +358,13 @@ def periodic_namespace_reconciliation(spec, name, logger, **kwargs):
         return
 
     try:
-        # List all workspaces
-        api = client.CustomObjectsApi()
-        workspaces = api.list_namespaced_custom_object(
-            group="xcp.tetrate.io",
-            version="v2",
-            namespace="tsb",
-            plural="workspaces"
-        )
-        
-        for workspace in workspaces.get('items', []):
-            workspace_labels = workspace.get('metadata', {}).get('labels', {})
-            if workspace_labels.get('arca.io/managed') == 'true':
-                namespace_name = workspace_labels.get('arca.io/namespace')
-                if namespace_name:
-                    create_namespace(
-                        namespace_name,
-                        {'arca.io/managed': 'true', 'arca.io/workspace': workspace['metadata']['name']},
-                        {'arca.io/workspace-fqn': workspace.get('metadata', {}).get('annotations', {}).get('tsb.tetrate.io/fqn', '')}
-                    )
+        # Walk the workspaces seen by watch_workspaces instead of listing them again, and
+        # only queue namespaces whose namespace or gateway the watches have not seen
+        for namespace_name, (labels, annotations) in list(_workspace_cache.items()):
+            if namespace_name not in _namespace_cache or namespace_name not in _gateway_cache:
+                logger.info("Reconciliation: namespace %s or its gateway is missing, queueing it", namespace_name)
+                enqueue_namespace(namespace_name, labels, annotations)
                 
     except Exception as e:
-        logger.error(f"Error during periodic reconciliation: {str(e)}")
+        logger.error("Error during periodic reconciliation: %s", e)
         raise kopf.TemporaryError(f"Reconciliation failed: {str(e)}", delay=300) 
\ No newline at end of file
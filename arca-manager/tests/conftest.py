@@ -0,0 +1,27 @@
+import os
+import tempfile
+from pathlib import Path
+
+# manager.py loads the Kubernetes configuration on import; outside a cluster, point it at a
+# throwaway kubeconfig so the tests never need (or touch) a real one
+if 'KUBECONFIG' not in os.environ and not Path('~/.kube/config').expanduser().exists():
+    _kubeconfig = Path(tempfile.mkdtemp()) / 'config'
+    _kubeconfig.write_text("""\
+apiVersion: v1
+kind: Config
+clusters:
+- name: test
+  cluster:
+    server: https://kubernetes.test
+contexts:
+- name: test
+  context:
+    cluster: test
+    user: test
+current-context: test
+users:
+- name: test
+  user:
+    token: test
+""")
+    os.environ['KUBECONFIG'] = str(_kubeconfig)
@@ -0,0 +1,125 @@
+import json
+import pytest
+import urllib3
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit, parse_qs
+from kubernetes import client
+import manager
+from manager import (
+    create_namespace,
+    create_application_gateway,
+    _retry_namespace,
+    FIELD_MANAGER,
+    APPLY_CONTENT_TYPE,
+    _GATEWAY_SPEC
+)
+
+# Test data
+TEST_NAMESPACE = "test-namespace"
+TEST_LABELS = {"arca.io/managed": "true", "arca.io/workspace": "test-workspace"}
+TEST_ANNOTATIONS = {"arca.io/config-mode": "BRIDGED"}
+
+@pytest.fixture
+def k8s_requests():
+    """Real Kubernetes API clients whose HTTP requests are recorded instead of sent."""
+    configuration = client.Configuration()
+    configuration.host = "https://kubernetes.test"
+    api_client = client.ApiClient(configuration)
+    recorded = []
+
+    def request(method, url, body=None, headers=None, **kwargs):
+        recorded.append({'method': method, 'url': url, 'body': body, 'headers': headers})
+        return urllib3.HTTPResponse(
+            body=b'{}', status=200, headers={'Content-Type': 'application/json'}, preload_content=True
+        )
+
+    api_client.rest_client.pool_manager = Mock(request=Mock(side_effect=request))
+    with patch('manager.get_core_v1_api', return_value=client.CoreV1Api(api_client)), \
+         patch('manager.get_custom_objects_api', return_value=client.CustomObjectsApi(api_client)), \
+         patch.dict(manager._namespace_cache, clear=True), \
+         patch.dict(manager._gateway_cache, clear=True):
+        yield recorded
+
+def assert_applied(request, path):
+    """Check that a recorded request is a forced server-side apply by arca-manager."""
+    url = urlsplit(request['url'])
+    assert request['method'] == 'PATCH'
+    assert url.path == path
+    assert request['headers']['Content-Type'] == APPLY_CONTENT_TYPE
+    query = parse_qs(url.query)
+    assert query['fieldManager'] == [FIELD_MANAGER]
+    # Spelled 'True' by some client releases; the API server parses booleans either way
+    assert [value.lower() for value in query['force']] == ['true']
+
+class TestServerSideApply:
+    def test_create_namespace_applies_namespace_and_gateway(self, k8s_requests):
+        """Test namespace and gateway are both applied in one call each."""
+        create_namespace(TEST_NAMESPACE, TEST_LABELS, TEST_ANNOTATIONS)
+
+        assert len(k8s_requests) == 2
+        namespace_request, gateway_request = k8s_requests
+
+        assert_applied(namespace_request, f"/api/v1/namespaces/{TEST_NAMESPACE}")
+        assert json.loads(namespace_request['body'])['metadata'] == {
+            'name': TEST_NAMESPACE,
+            'labels': TEST_LABELS,
+            'annotations': TEST_ANNOTATIONS
+        }
+
+        assert_applied(
+            gateway_request,
+            f"/apis/install.tetrate.io/v1alpha1/namespaces/{TEST_NAMESPACE}/gateways/{TEST_NAMESPACE}-gateway"
+        )
+        assert json.loads(gateway_request['body'])['spec'] == _GATEWAY_SPEC
+
+    def test_create_namespace_skips_applied_objects(self, k8s_requests):
+        """Test nothing is sent when the watches have already seen the desired state."""
+        manager._namespace_cache[TEST_NAMESPACE] = {
+            'labels': dict(TEST_LABELS, extra='kept'),
+            'annotations': dict(TEST_ANNOTATIONS)
+        }
+        manager._gateway_cache[TEST_NAMESPACE] = json.loads(json.dumps(_GATEWAY_SPEC))
+
+        create_namespace(TEST_NAMESPACE, TEST_LABELS, TEST_ANNOTATIONS)
+
+        assert k8s_requests == []
+
+    def test_create_application_gateway_reapplies_drifted_spec(self, k8s_requests):
+        """Test a gateway whose spec no longer matches is applied again."""
+        manager._gateway_cache[TEST_NAMESPACE] = {'type': 'INGRESS'}
+
+        create_application_gateway(TEST_NAMESPACE)
+
+        assert len(k8s_requests) == 1
+
+@pytest.fixture
+def queue():
+    """Empty workspace cache and pending queue, restored afterwards."""
+    with patch.dict(manager._workspace_cache, clear=True), patch.dict(manager._pending, clear=True):
+        yield manager._pending
+
+class TestRetry:
+    def test_retry_uses_current_workspace_metadata(self, queue):
+        """Test a retry queues what the workspace wants now, not what failed."""
+        current = ({"arca.io/workspace": "renamed"}, TEST_ANNOTATIONS)
+        manager._workspace_cache[TEST_NAMESPACE] = current
+
+        _retry_namespace(TEST_NAMESPACE)
+
+        assert queue == {TEST_NAMESPACE: current}
+
+    def test_retry_dropped_for_deleted_workspace(self, queue):
+        """Test a retry does not resurrect a namespace whose workspace is gone."""
+        _retry_namespace(TEST_NAMESPACE)
+
+        assert queue == {}
+
+    def test_retry_keeps_newer_pending_request(self, queue):
+        """Test a retry does not replace a request queued since the failure."""
+        manager._workspace_cache[TEST_NAMESPACE] = (TEST_LABELS, TEST_ANNOTATIONS)
+        newer = ({"arca.io/workspace": "newer"}, {})
+        queue[TEST_NAMESPACE] = newer
+
+        _retry_namespace(TEST_NAMESPACE)
+
+        assert queue == {TEST_NAMESPACE: newer}